@@ -7,7 +7,7 @@ Classes:
 
 from collections import UserDict
 from ruamel.yaml import YAML
-from ruamel.yaml.scanner import ScannerError
+from ruamel.yaml.error import MarkedYAMLError
 
 import logging
 import os
@@ -57,10 +57,9 @@ class Config(UserDict):
         Arguments:
             key(str): Configuration key to fetch
         """
-        keys = key.split('.')
-        value = self.data.copy()
+        value = self.data
 
-        for key in keys:
+        for key in key.split('.'):
             value = value[key]
 
         return value
@@ -74,7 +73,7 @@ class Config(UserDict):
             with open(os.path.expanduser(self.config_path), 'r') as f:
                 try:
                     self.data = YAML().load(f)
-                except ScannerError as e:
+                except MarkedYAMLError as e:
                     log.error(
                         'Error parsing yaml of configuration file '
                         '{}: {}'.format(
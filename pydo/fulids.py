@@ -5,6 +5,7 @@ Classes:
     fulid: Class to generate friendly ulids based on a character set.
 """
 
+import os
 import ulid
 
 
@@ -33,9 +34,12 @@ class fulid:
         _encode_id: Method to transform a number into an id string.
 
     Public attributes:
-        charset (list): List of available characters to build the id.
-        forbidden_charset (list): List of forbidden characters to build the id.
+        charset (tuple): Available characters to build the id.
+        forbidden_charset (tuple): Forbidden characters to build the id.
         str (str): String representation of the fulid
+
+    Private attributes:
+        _charset_index (dict): Position of each character in the charset.
     """
 
     def __init__(
@@ -44,8 +48,8 @@ class fulid:
         forbidden_charset='ilou|&:;()<>~*@?!$#[]{}\\/\'"`',
         fulid=None,
     ):
-        self.charset = list(character_set)
-        self.forbidden_charset = list(forbidden_charset)
+        self.charset = character_set
+        self.forbidden_charset = tuple(forbidden_charset)
         self.str = fulid
 
         forbidden_characters = set(self.charset).intersection(
@@ -59,6 +63,22 @@ class fulid:
                 )
             )
 
+    @property
+    def charset(self):
+        return self._charset
+
+    @charset.setter
+    def charset(self, character_set):
+        """
+        Store the charset and index the position of each character, so
+        _decode_id doesn't need to search them.
+        """
+        self._charset = tuple(character_set)
+        self._charset_index = {
+            character: index
+            for index, character in enumerate(self._charset)
+        }
+
     def __repr__(self):
         return '<{}({!r})>'.format(self.__class__.__name__, self.str)
 
@@ -156,14 +176,20 @@ class fulid:
             number (int): Decoded number
         """
 
+        if len(number_string) == 0:
+            raise ValueError('Error decoding an empty string into a number')
+
         if len(number_string) > 7:
             number_string = number_string[-7:]
 
-        num = []
+        base = len(self.charset)
+        number = 0
+
         for character in number_string:
             try:
-                num.append(str(self.charset.index(character.lower())))
-            except ValueError:
+                number = number * base + \
+                    self._charset_index[character.lower()]
+            except KeyError:
                 raise ValueError(
                     'Error decoding {} into a number as character {} is not '
                     'in the configuration fulid.characters'.format(
@@ -171,7 +197,7 @@ class fulid:
                         character,
                     )
                 )
-        return int(''.join(num))
+        return number
 
     def _encode_id(self, number, pad=None):
         """
@@ -188,20 +214,16 @@ class fulid:
         base = len(self.charset)
         number_characters = []
 
-        if number == 0:
-            number_characters.append(self.charset[0].upper())
-
-        while number != 0:
-            remainder = number % base
-            if remainder < base:
-                number_characters.append(self.charset[remainder].upper())
-            number = number // base
+        while True:
+            number, remainder = divmod(number, base)
+            number_characters.append(self.charset[remainder])
+            if number == 0:
+                break
 
-        number_string = ''.join(number_characters[::-1])
+        number_string = ''.join(reversed(number_characters))
 
-        if pad is not None and len(number_string) != pad:
-            pad_string = self.charset[0].upper() * (pad - len(number_string))
-            number_string = pad_string + number_string
+        if pad is not None:
+            number_string = number_string.rjust(pad, self.charset[0])
 
         return number_string.upper()
 
@@ -219,6 +241,9 @@ class fulid:
 
         Once we've got all return the equivalence in a dictionary.
 
+        Repeated fulids are ignored to compute the length, so they share the
+        same sulid as if they were given once.
+
         Arguments:
             fuilds (list): List of fulids to shorten.
 
@@ -227,16 +252,18 @@ class fulid:
         """
         work_fulids = [fulid.lower()[::-1] for fulid in fulids]
 
+        # The sulids need one character more than the longest common prefix
+        # of the reversed fulids, and once sorted, it's shared by neighbours.
+        sorted_fulids = sorted(set(work_fulids))
         char_num = 1
-        while True:
-            work_sulids = [fulid[:char_num] for fulid in work_fulids]
-            if len(work_sulids) == len(set(work_sulids)):
-                sulids = {
-                    fulids[index]: work_sulids[index][::-1]
-                    for index in range(0, len(fulids))
-                }
-                return sulids
-            char_num += 1
+        for previous, current in zip(sorted_fulids, sorted_fulids[1:]):
+            common_prefix = os.path.commonprefix([previous, current])
+            char_num = max(char_num, len(common_prefix) + 1)
+
+        return {
+            fulids[index]: work_fulids[index][:char_num][::-1]
+            for index in range(0, len(fulids))
+        }
 
     def sulid_to_fulid(self, sulid, fulids):
         """
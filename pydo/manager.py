@@ -15,6 +15,39 @@ import re
 
 log = logging.getLogger(__name__)
 
+# Date regular expressions, compiled once as DateManager.convert runs them
+# for every date argument.
+datetime_regexp = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}')
+date_regexp = re.compile(r'[0-9]{4}.[0-9]{2}.[0-9]{2}')
+date_modifier_regexp = re.compile(r'(?P<value>[0-9]+)(?P<unit>.*)')
+
+# Weekday numbers (0 == monday) of the human weekday strings, indexed by their
+# first three letters, so 'mon', 'monday' or 'mondays' are all accepted.
+weekdays = {
+    'mon': 0,
+    'tue': 1,
+    'wed': 2,
+    'thu': 3,
+    'fri': 4,
+    'sat': 5,
+    'sun': 6,
+}
+
+# dateutil.relativedelta weekdays indexed by weekday number.
+relativedelta_weekdays = (MO, TU, WE, TH, FR, SA, SU)
+
+# dateutil.relativedelta arguments of the date modifier units, the relative
+# months (rmo) are computed by DateManager._next_monthday.
+date_modifier_units = {
+    's': 'seconds',
+    'm': 'minutes',
+    'h': 'hours',
+    'd': 'days',
+    'w': 'weeks',
+    'mo': 'months',
+    'y': 'years',
+}
+
 
 class TableManager:
     """
@@ -175,6 +208,7 @@ class TaskManager(TableManager):
         _update: Parent method to update table elements.
 
     Public attributes:
+        agile_states (frozenset): Allowed agile states.
         date (DateManager): DateManager object.
         fulid (fulid object): Fulid manager and generator object.
         session (session object): Database session
@@ -183,6 +217,9 @@ class TaskManager(TableManager):
 
     def __init__(self, session):
         super().__init__(session, Task)
+        self.agile_states = frozenset(
+            config.get('task.agile.allowed_states')
+        )
         self.date = DateManager()
         self.fulid = fulid(
             config.get('fulid.characters'),
@@ -444,8 +481,7 @@ class TaskManager(TableManager):
             task_attributes (dict): Dictionary with the attributes of the task.
             agile (str): Task agile state.
         """
-        if agile is not None and \
-                agile not in config.get('task.agile.allowed_states'):
+        if agile is not None and agile not in self.agile_states:
             raise ValueError(
                 'Agile state {} is not between the specified '
                 'by task.agile.states'.format(agile)
@@ -815,29 +851,30 @@ class DateManager:
         _weekday: Method to return the dateutil.relativedelta weekday.
     """
 
-    def convert(self, human_date, starting_date=datetime.datetime.now()):
+    def convert(self, human_date, starting_date=None):
         """
         Method to convert a human string into a datetime object
 
         Arguments:
             human_date (str): Date string to convert
             starting_date (datetime): Date to compare.
+                Default: now, taken on each call.
 
         Returns:
             date (datetime)
         """
 
+        if starting_date is None:
+            starting_date = datetime.datetime.now()
+
         date = self._convert_weekday(human_date, starting_date)
 
         if date is not None:
             return date
 
-        if re.match(
-            r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}',
-            human_date,
-        ):
+        if datetime_regexp.match(human_date):
             return datetime.datetime.strptime(human_date, '%Y-%m-%dT%H:%M')
-        elif re.match(r'[0-9]{4}.[0-9]{2}.[0-9]{2}', human_date,):
+        elif date_regexp.match(human_date):
             return datetime.datetime.strptime(human_date, '%Y-%m-%d')
         elif re.match(r'(now|today)', human_date):
             return starting_date
@@ -860,24 +897,14 @@ class DateManager:
             date (datetime)
         """
 
-        if re.match(r'mon.*', human_date):
-            return self._next_weekday(0, starting_date)
-        elif re.match(r'tue.*', human_date):
-            return self._next_weekday(1, starting_date)
-        elif re.match(r'wed.*', human_date):
-            return self._next_weekday(2, starting_date)
-        elif re.match(r'thu.*', human_date):
-            return self._next_weekday(3, starting_date)
-        elif re.match(r'fri.*', human_date):
-            return self._next_weekday(4, starting_date)
-        elif re.match(r'sat.*', human_date):
-            return self._next_weekday(5, starting_date)
-        elif re.match(r'sun.*', human_date):
-            return self._next_weekday(6, starting_date)
-        else:
+        weekday = weekdays.get(human_date[:3])
+
+        if weekday is None:
             return None
 
-    def _str2date(self, modifier, starting_date=datetime.datetime.now()):
+        return self._next_weekday(weekday, starting_date)
+
+    def _str2date(self, modifier, starting_date):
         """
         Method do operations on dates with short codes.
 
@@ -899,32 +926,25 @@ class DateManager:
             resulting_date (datetime)
         """
 
-        date_delta = relativedelta()
+        delta_arguments = {}
+        relative_months_delta = relativedelta()
         for element in modifier.split(' '):
-            element = re.match(r'(?P<value>[0-9]+)(?P<unit>.*)', element)
+            element = date_modifier_regexp.match(element)
             value = int(element.group('value'))
             unit = element.group('unit')
 
-            if unit == 's':
-                date_delta += relativedelta(seconds=value)
-            elif unit == 'm':
-                date_delta += relativedelta(minutes=value)
-            elif unit == 'h':
-                date_delta += relativedelta(hours=value)
-            elif unit == 'd':
-                date_delta += relativedelta(days=value)
-            elif unit == 'mo':
-                date_delta += relativedelta(months=value)
-            elif unit == 'w':
-                date_delta += relativedelta(weeks=value)
-            elif unit == 'y':
-                date_delta += relativedelta(years=value)
-            elif unit == 'rmo':
-                date_delta += self._next_monthday(value, starting_date) - \
-                    starting_date
+            if unit == 'rmo':
+                relative_months_delta += \
+                    self._next_monthday(value, starting_date) - starting_date
+            elif unit in date_modifier_units:
+                argument = date_modifier_units[unit]
+                delta_arguments[argument] = \
+                    delta_arguments.get(argument, 0) + value
+
+        date_delta = relativedelta(**delta_arguments) + relative_months_delta
         return starting_date + date_delta
 
-    def _next_weekday(self, weekday, starting_date=datetime.datetime.now()):
+    def _next_weekday(self, weekday, starting_date):
         """
         Method to get the next week day of a given date.
 
@@ -936,15 +956,12 @@ class DateManager:
             next_week_day (datetime)
         """
 
-        if weekday == starting_date.weekday():
-            starting_date = starting_date + relativedelta(days=1)
+        # Days till the next weekday, a week if it's the starting weekday.
+        days = (weekday - starting_date.weekday() - 1) % 7 + 1
 
-        weekday = self._weekday(weekday)
+        return starting_date + relativedelta(days=days)
 
-        date_delta = relativedelta(day=starting_date.day, weekday=weekday,)
-        return starting_date + date_delta
-
-    def _next_monthday(self, months, starting_date=datetime.datetime.now()):
+    def _next_monthday(self, months, starting_date):
         """
         Method to get the difference between for the next same week day of the
         month for the specified months.
@@ -954,6 +971,7 @@ class DateManager:
 
         Arguments:
             months (int): Number of months to skip.
+            starting_date (datetime): Date to compare
 
         Returns:
             next_week_day ()
@@ -982,18 +1000,4 @@ class DateManager:
             weekday (datetil.relativedelta.weekday)
         """
 
-        if weekday == 0:
-            weekday = MO
-        elif weekday == 1:
-            weekday = TU
-        elif weekday == 2:
-            weekday = WE
-        elif weekday == 3:
-            weekday = TH
-        elif weekday == 4:
-            weekday = FR
-        elif weekday == 5:
-            weekday = SA
-        elif weekday == 6:
-            weekday = SU
-        return weekday
+        return relativedelta_weekdays[weekday]
@@ -13,8 +13,10 @@ import os
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-fileConfig(config.config_file_name)
+# This line sets up loggers basically. Callers that manage logging themselves,
+# like the test suite, can opt out with the configure_logger attribute.
+if config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
@@ -79,7 +81,10 @@ def run_migrations_online():
     #     poolclass=pool.NullPool,
     # )
 
-    connectable = create_engine(get_url())
+    # Reuse the engine or connection given by the caller if there is any.
+    connectable = config.attributes.get('connection', None)
+    if connectable is None:
+        connectable = create_engine(get_url())
 
     with connectable.connect() as connection:
         context.configure(
@@ -1,35 +1,150 @@
-from alembic.command import upgrade
-from alembic.config import Config
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+import hashlib
+import logging
 import os
 import pytest
-import tempfile
 
 os.environ['PYDO_CONFIG'] = 'assets/config.yaml'
 
-temp_ddbb = tempfile.mkstemp()[1]
-sqlalchemy_url = 'sqlite:///{}'.format(temp_ddbb)
+# In memory database, pydo.models.engine keeps one connection per thread, so
+# pydo, alembic and the tests share it.
+sqlalchemy_url = 'sqlite://'
 os.environ['PYDO_DATABASE_URL'] = sqlalchemy_url
 
 # It needs to be after the environmental variable
+from pydo import models
+from pydo.cli import load_parser
 from tests import factories
 
 
-@pytest.fixture(scope='module')
-def connection():
+@pytest.fixture(autouse=True)
+def log_level(caplog):
     '''
-    Fixture to set up the connection to the temporal database, the path is
-    stablished at conftest.py
+    Fixture to only capture the error log records, the tests assert the
+    program logs through mocks, so the rest of the records are never read.
+
+    Tests that need them can lower the level with caplog.set_level.
+    '''
+
+    caplog.set_level(logging.ERROR)
+
+
+@pytest.fixture(scope='session')
+def fake():
+    '''
+    Fixture to share the Faker object of the factories, as building another
+    one loads all the locale providers again.
     '''
 
-    # Create database connection
-    connection = create_engine(sqlalchemy_url).connect()
+    return factories.fake
+
+
+@pytest.fixture(scope='session')
+def corpus(fake):
+    '''
+    Fixture to generate the fake sentences and words once per session, so the
+    tests can index them instead of calling the faker providers each time.
+    '''
+
+    return {
+        'sentences': [fake.sentence() for _ in range(64)],
+        'words': [fake.word() for _ in range(64)],
+    }
+
+
+@pytest.fixture(scope='session')
+def parser():
+    '''
+    Fixture to build the command line parser once per session, parse_args
+    doesn't change its state.
+    '''
+
+    return load_parser()
+
+
+@pytest.fixture(scope='session')
+def connection(request):
+    '''
+    Fixture to set up the connection to the in memory database, the url is
+    stablished at conftest.py
+
+    The database is migrated once per session, each test is isolated by the
+    transaction that the session fixture rolls back.
+
+    The migrated schema is stored in the pytest cache, so the next runs
+    can load it instead of applying the migrations while the migration
+    files don't change. Without the cacheprovider plugin the migrations are
+    applied on each run.
+
+    Under pytest-xdist only the gw0 worker stores the schema, so the workers
+    don't write the cache entry at the same time.
+    '''
 
-    # Applies all alembic migrations.
-    config = Config('pydo/migrations/alembic.ini')
-    upgrade(config, 'head')
+    # Hash the migration files instead of loading them with ScriptDirectory
+    # to know if the cached schema is still at head.
+    versions_directory = 'pydo/migrations/versions'
+    migrations = []
+    for file_name in sorted(os.listdir(versions_directory)):
+        if file_name.endswith('.py'):
+            with open(os.path.join(versions_directory, file_name), 'rb') as f:
+                migrations.append(
+                    [file_name, hashlib.sha256(f.read()).hexdigest()]
+                )
+
+    cache = getattr(request.config, 'cache', None)
+    if cache is None:
+        cached_schema = {}
+    else:
+        cached_schema = cache.get('pydo/migrated_schema', {})
+
+    # Create database connection with the engine built by pydo.models from
+    # PYDO_DATABASE_URL, instead of building another one.
+    connection = models.engine.connect()
+
+    # Keep the migrations silent, we don't want to format the DDL statements.
+    # The loggers are restored once the schema is loaded so the quieting
+    # doesn't leak into the tests.
+    sqlalchemy_logger = logging.getLogger('sqlalchemy')
+    sqlalchemy_engine_logger = logging.getLogger('sqlalchemy.engine')
+    alembic_logger = logging.getLogger('alembic')
+    previous_logging = (
+        sqlalchemy_logger.propagate,
+        sqlalchemy_engine_logger.level,
+        alembic_logger.level,
+    )
+    sqlalchemy_engine_logger.setLevel(logging.WARNING)
+    sqlalchemy_logger.propagate = False
+    alembic_logger.setLevel(logging.WARNING)
+
+    try:
+        if cached_schema.get('migrations') == migrations:
+            connection.connection.executescript(cached_schema['sql'])
+        else:
+            # The alembic configuration is only parsed when the schema needs to
+            # be migrated, import alembic here to skip it on the usual runs.
+            from alembic.command import upgrade
+            from alembic.config import Config
+
+            config = Config('pydo/migrations/alembic.ini')
+            config.attributes['configure_logger'] = False
+            config.attributes['connection'] = models.engine
+
+            # Applies all alembic migrations.
+            upgrade(config, 'head')
+            if cache is not None and \
+                    os.getenv('PYTEST_XDIST_WORKER', 'gw0') == 'gw0':
+                cache.set(
+                    'pydo/migrated_schema',
+                    {
+                        'migrations': migrations,
+                        'sql': '\n'.join(connection.connection.iterdump()),
+                    },
+                )
+    finally:
+        sqlalchemy_logger.propagate = previous_logging[0]
+        sqlalchemy_engine_logger.setLevel(previous_logging[1])
+        alembic_logger.setLevel(previous_logging[2])
 
     # End of setUp
 
@@ -1,3 +1,4 @@
+from faker import Faker
 from pydo import config
 from pydo.fulids import fulid
 from pydo import models
@@ -7,61 +8,68 @@ import random
 
 # XXX If you add new Factories remember to add the session in conftest.py
 
+# Choices of the random attributes, picked with random.choice instead of the
+# faker word provider.
+TASK_STATES = tuple(config.get('task.allowed_states'))
+TASK_AGILE_STATES = ('backlog', 'todo', None)
+RECURRENCES = ('1d', '1rmo', '1y2mo30s')
+RECURRENCE_TYPES = ('repeating', 'recurring')
+
+# Shared by the factories and the fake fixture. It's not seeded on purpose,
+# so each run feeds the tests different titles, descriptions and dates, and
+# the state and recurrence choices go through the unseeded random module
+# anyway.
+fake = Faker()
+task_fulid = fulid()
+
 
 class ProjectFactory(factory.alchemy.SQLAlchemyModelFactory):
     """
     Class to generate a fake project.
     """
     id = factory.Sequence(lambda n: 'project_{}'.format(n))
-    description = factory.Faker('sentence')
+    description = factory.LazyFunction(fake.sentence)
 
     class Meta:
         model = models.Project
-        sqlalchemy_session_persistence = 'commit'
+        sqlalchemy_session_persistence = 'flush'
 
 
 class TaskFactory(factory.alchemy.SQLAlchemyModelFactory):
-    id = factory.LazyFunction(lambda: fulid().new().str)
-    title = factory.Faker('sentence')
-    state = factory.Faker(
-        'word',
-        ext_word_list=config.get('task.allowed_states')
-    )
-    agile = factory.Faker('word', ext_word_list=['backlog', 'todo', None])
+    id = factory.LazyFunction(lambda: task_fulid.new().str)
+    title = factory.LazyFunction(fake.sentence)
+    state = factory.LazyFunction(lambda: random.choice(TASK_STATES))
+    agile = factory.LazyFunction(lambda: random.choice(TASK_AGILE_STATES))
     type = 'task'
-    priority = factory.Faker('random_number')
+    priority = factory.LazyFunction(fake.random_number)
 
     # Let half the tasks have a due date
 
     @factory.lazy_attribute
     def due(self):
-        if random.random() > 0.5:
-            return factory.Faker('date_time').generate({})
+        if random.getrandbits(1):
+            return fake.date_time()
 
     @factory.lazy_attribute
     def closed(self):
         if self.state == 'completed' or self.state == 'deleted':
-            return factory.Faker('date_time').generate({})
+            return fake.date_time()
 
     class Meta:
         model = models.Task
-        sqlalchemy_session_persistence = 'commit'
+        sqlalchemy_session_persistence = 'flush'
 
 
 class RecurrentTaskFactory(TaskFactory):
-    recurrence = factory.Faker(
-        'word',
-        ext_word_list=['1d', '1rmo', '1y2mo30s']
-    )
-    recurrence_type = factory.Faker(
-        'word',
-        ext_word_list=['repeating', 'recurring']
+    recurrence = factory.LazyFunction(lambda: random.choice(RECURRENCES))
+    recurrence_type = factory.LazyFunction(
+        lambda: random.choice(RECURRENCE_TYPES)
     )
     type = 'recurrent_task'
 
     class Meta:
         model = models.RecurrentTask
-        sqlalchemy_session_persistence = 'commit'
+        sqlalchemy_session_persistence = 'flush'
 
 
 class TagFactory(factory.alchemy.SQLAlchemyModelFactory):
@@ -69,8 +77,37 @@ class TagFactory(factory.alchemy.SQLAlchemyModelFactory):
     Class to generate a fake tag.
     """
     id = factory.Sequence(lambda n: 'tag_{}'.format(n))
-    description = factory.Faker('sentence')
+    description = factory.LazyFunction(fake.sentence)
 
     class Meta:
         model = models.Tag
-        sqlalchemy_session_persistence = 'commit'
+        sqlalchemy_session_persistence = 'flush'
+
+
+def insert_tasks(session, size, **kwargs):
+    """
+    Build a batch of tasks and insert them with one Core statement.
+
+    Useful when the test only needs the rows in the database, as it skips the
+    ORM unit of work and the identity map.
+
+    Arguments:
+        session (session object): Database session.
+        size (int): Number of tasks to insert.
+        **kwargs: (object) Task attributes to override (key: value).
+
+    Returns:
+        tasks (list): Built Task objects, not attached to the session.
+    """
+    tasks = TaskFactory.build_batch(size, **kwargs)
+    columns = models.Task.__table__.columns.keys()
+
+    session.execute(
+        models.Task.__table__.insert(),
+        [
+            {column: getattr(task, column) for column in columns}
+            for task in tasks
+        ],
+    )
+
+    return tasks
@@ -1,5 +1,4 @@
-from faker import Faker
-from pydo.cli import load_parser, load_logger
+from pydo.cli import load_logger
 from unittest.mock import patch, call
 
 
@@ -11,9 +10,10 @@ import ulid
 class TestArgparse:
 
     @pytest.fixture(autouse=True)
-    def setup(self):
-        self.fake = Faker()
-        self.parser = load_parser()
+    def setup(self, corpus, parser):
+        self.sentences = corpus['sentences']
+        self.words = corpus['words']
+        self.parser = parser
 
     def test_can_specify_install_subcommand(self):
         parsed = self.parser.parse_args(['install'])
@@ -22,15 +22,15 @@ class TestArgparse:
     def test_can_specify_add_subcommand(self):
         arguments = [
             'add',
-            self.fake.sentence(),
+            self.sentences[0],
         ]
         parsed = self.parser.parse_args(arguments)
         assert parsed.subcommand == arguments[0]
         assert parsed.add_argument == [arguments[1]]
 
     def test_can_specify_project_in_add_subcommand(self):
-        description = self.fake.sentence()
-        project_id = self.fake.word()
+        description = self.sentences[1]
+        project_id = self.words[0]
         arguments = [
             'add',
             description,
@@ -43,8 +43,8 @@ class TestArgparse:
     def test_can_specify_modify_subcommand(self):
         arguments = [
             'mod',
-            self.fake.word(),
-            self.fake.sentence(),
+            self.words[1],
+            self.sentences[2],
         ]
         parsed = self.parser.parse_args(arguments)
         assert parsed.subcommand == arguments[0]
@@ -52,11 +52,11 @@ class TestArgparse:
         assert parsed.modify_argument == [arguments[2]]
 
     def test_can_specify_project_in_modify_subcommand(self):
-        description = self.fake.sentence()
-        project_id = self.fake.word()
+        description = self.sentences[3]
+        project_id = self.words[2]
         arguments = [
             'mod',
-            self.fake.word(),
+            self.words[3],
             description,
             'pro:{}'.format(project_id),
         ]
@@ -67,11 +67,11 @@ class TestArgparse:
         assert parsed.parent is False
 
     def test_can_specify_parent_in_modify_subcommand(self):
-        description = self.fake.sentence()
+        description = self.sentences[4]
         arguments = [
             'mod',
             '-p',
-            self.fake.word(),
+            self.words[4],
             description,
         ]
         parsed = self.parser.parse_args(arguments)
@@ -1,13 +1,34 @@
 from pydo.configuration import Config
 from unittest.mock import patch
+from ruamel.yaml.parser import ParserError
 from ruamel.yaml.scanner import ScannerError
 
+import copy
 import os
 import pytest
 import shutil
 import tempfile
 
 
+@pytest.fixture(scope='session')
+def asset_config():
+    '''
+    Fixture to parse the assets configuration file once per session.
+    '''
+
+    return Config('assets/config.yaml')
+
+
+@pytest.fixture(scope='session')
+def missing_config_file(tmp_path_factory):
+    '''
+    Fixture to build the path to a configuration file that doesn't exist once
+    per session.
+    '''
+
+    return str(tmp_path_factory.mktemp('config') / 'missing.yaml')
+
+
 class TestConfig:
     """
     Class to test the Config object.
@@ -17,14 +38,14 @@ class TestConfig:
     """
 
     @pytest.fixture(autouse=True)
-    def setup(self):
-        self.config_path = 'assets/config.yaml'
+    def setup(self, asset_config):
+        self.config_path = asset_config.config_path
         self.log_patch = patch('pydo.configuration.log', autospect=True)
         self.log = self.log_patch.start()
         self.sys_patch = patch('pydo.configuration.sys', autospect=True)
         self.sys = self.sys_patch.start()
 
-        self.config = Config(self.config_path)
+        self.config = copy.deepcopy(asset_config)
         yield 'setup'
 
         self.log_patch.stop()
@@ -52,9 +73,16 @@ class TestConfig:
         self.config.load()
         assert len(self.config.data['task']) > 0
 
+    @pytest.mark.parametrize(
+        'error',
+        [
+            ParserError,
+            ScannerError,
+        ]
+    )
     @patch('pydo.configuration.YAML')
-    def test_load_handles_wrong_file_format(self, yamlMock):
-        yamlMock.return_value.load.side_effect = ScannerError(
+    def test_load_handles_wrong_file_format(self, yamlMock, error):
+        yamlMock.return_value.load.side_effect = error(
             'error',
             '',
             'problem',
@@ -62,20 +90,19 @@ class TestConfig:
         )
 
         self.config.load()
+
         self.log.error.assert_called_once_with(
             'Error parsing yaml of configuration file mark: problem'
         )
         self.sys.exit.assert_called_once_with(1)
 
-    @patch('pydo.configuration.open')
-    def test_load_handles_file_not_found(self, openMock):
-        openMock.side_effect = FileNotFoundError()
+    def test_load_handles_file_not_found(self, missing_config_file):
+        self.config.config_path = missing_config_file
 
         self.config.load()
+
         self.log.error.assert_called_once_with(
-            'Error opening configuration file {}'.format(
-                self.config_path
-            )
+            'Error opening configuration file {}'.format(missing_config_file)
         )
         self.sys.exit.assert_called_once_with(1)
 
@@ -95,3 +122,15 @@ class TestConfig:
             assert "a:" in f.read()
 
         shutil.rmtree(tmp)
+
+    def test_save_config_keeps_the_file_comments(self, tmp_path):
+        save_file = tmp_path / 'yaml_comments_test.yaml'
+        save_file.write_text('# Task options\nb: c\na: b  # Inline\n')
+        self.config = Config(str(save_file))
+
+        self.config.save()
+
+        saved_config = save_file.read_text()
+        assert '# Task options' in saved_config
+        assert '# Inline' in saved_config
+        assert saved_config.index('b:') < saved_config.index('a:')
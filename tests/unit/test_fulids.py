@@ -11,15 +11,11 @@ class Testfulid:
     expect.
 
     Public attributes:
-        alembic (mock): alembic mock.
-        homedir (string): User home directory path
-        log (mock): logging mock
-        session (Session object): Database session.
+        fulid (fulid object): fulid object to test.
     """
 
     @pytest.fixture(autouse=True)
-    def setup(self, session):
-        self.session = session
+    def setup(self):
         self.fulid = fulid()
 
         yield 'setup'
@@ -30,21 +26,21 @@ class Testfulid:
             + " <fulid('{}')>>".format(self.fulid.str)
 
     def test_fulid_has_charset_attribute(self):
-        assert self.fulid.charset == list(config.get('fulid.characters'))
+        assert self.fulid.charset == tuple(config.get('fulid.characters'))
 
     def test_fulid_has_forbidden_charset_attribute(self):
         assert self.fulid.forbidden_charset == \
-            list(config.get('fulid.forbidden_characters'))
+            tuple(config.get('fulid.forbidden_characters'))
 
     def test_fulid_has_fulid_attribute_none_by_default(self):
         assert self.fulid.str is None
 
     def test_fulid_has_charset_attribute_set_by_default(self):
-        assert self.fulid.charset == list(config.get('fulid.characters'))
+        assert self.fulid.charset == tuple(config.get('fulid.characters'))
 
     def test_fulid_has_forbidden_charset_attribute_set_by_default(self):
         assert self.fulid.forbidden_charset == \
-            list(config.get('fulid.forbidden_characters'))
+            tuple(config.get('fulid.forbidden_characters'))
 
     def test_fulid_can_set_fulid_attribute(self):
         self.fulid = fulid(fulid='full_fulid_string')
@@ -52,11 +48,11 @@ class Testfulid:
 
     def test_fulid_can_set_charset_attribute(self):
         self.fulid = fulid(character_set='ab')
-        assert self.fulid.charset == ['a', 'b']
+        assert self.fulid.charset == ('a', 'b')
 
     def test_fulid_can_set_forbidden_charset_attribute(self):
         self.fulid = fulid(forbidden_charset='/')
-        assert self.fulid.forbidden_charset == ['/']
+        assert self.fulid.forbidden_charset == ('/',)
 
     def test_fulid_returns_timestamp(self):
         self.fulid.new()
@@ -124,6 +120,15 @@ class Testfulid:
         assert self.fulid._encode_id(0) == 'A'
         assert self.fulid._encode_id(2) == 'SA'
 
+    def test_decode_number_supports_base_different_than_10(self):
+        self.fulid.charset = ['a', 's']
+        assert self.fulid._decode_id('A') == 0
+        assert self.fulid._decode_id('SA') == 2
+
+    def test_decode_number_raises_error_if_string_is_empty(self):
+        with pytest.raises(ValueError):
+            self.fulid._decode_id('')
+
     def test_fulid_new_returns_sequential_id(self):
         assert self.fulid.new('01DW02J8WWJNB109DA0AAAAAAA').id() == 'AAAAAAS'
 
@@ -153,6 +158,18 @@ class Testfulid:
         }
         assert self.fulid.sulids(fulids) == expected_sulids
 
+    def test_short_fulids_ignores_repeated_fulids(self):
+        fulids = [
+            '01DWF3DM7EH40BTYB4SAAAAAAA',
+            '01DWF3ETGBK679178BNAAAAAAS',
+            '01DWF3DM7EH40BTYB4SAAAAAAA',
+        ]
+        expected_sulids = {
+            '01DWF3DM7EH40BTYB4SAAAAAAA': 'a',
+            '01DWF3ETGBK679178BNAAAAAAS': 's',
+        }
+        assert self.fulid.sulids(fulids) == expected_sulids
+
     def test_expand_sulid_returns_fulid_if_no_coincidence(self):
         fulids = [
             '01DWF3DM7EH40BTYB4SAAAAAAA',
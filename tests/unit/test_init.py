@@ -1,20 +1,28 @@
-from faker import Faker
 from pydo import config, main
 from pydo import models
-from unittest.mock import call, patch
+from unittest.mock import call, patch, Mock
 
 import pytest
-import ulid
+
+# The task id is only compared through the mocks, it doesn't need to be
+# generated for each test.
+TASK_ID = '01F8MECHZX3TBDSZ7XRADM79XE'
 
 
 class TestMain:
 
     @pytest.fixture(autouse=True)
-    def setup(self, session):
+    def setup(self, fake):
         self.engine_patch = patch('pydo.models.engine', autospect=True)
         self.engine = self.engine_patch.start()
 
-        self.fake = Faker()
+        self.export_patch = patch('pydo.export', autospect=True)
+        self.export = self.export_patch.start()
+
+        self.install_patch = patch('pydo.install', autospect=True)
+        self.install = self.install_patch.start()
+
+        self.fake = fake
 
         self.task_report_patch = patch('pydo.TaskReport', autospect=True)
         self.task_report = self.task_report_patch.start()
@@ -23,13 +31,22 @@ class TestMain:
         self.parser = self.parser_patch.start()
         self.parser_args = self.parser.return_value.parse_args.return_value
 
-        self.session = session
+        self.projects_patch = patch('pydo.Projects', autospect=True)
+        self.projects = self.projects_patch.start()
+
+        # main only hands the session to the patched objects, it doesn't
+        # need a database transaction.
+        self.session = Mock()
         self.sessionmaker_patch = patch(
             'pydo.sessionmaker',
             autospect=True
         )
         self.sessionmaker = self.sessionmaker_patch.start()
         self.sessionmaker.return_value.return_value = self.session
+        self.query = self.session.query
+
+        self.tags_patch = patch('pydo.Tags', autospect=True)
+        self.tags = self.tags_patch.start()
 
         self.tm_patch = patch('pydo.TaskManager', autospect=True)
         self.tm = self.tm_patch.start()
@@ -39,9 +56,13 @@ class TestMain:
         yield 'setup'
 
         self.engine_patch.stop()
+        self.export_patch.stop()
+        self.install_patch.stop()
         self.task_report_patch.stop()
         self.parser_patch.stop()
+        self.projects_patch.stop()
         self.sessionmaker_patch.stop()
+        self.tags_patch.stop()
         self.tm_patch.stop()
 
     def test_main_loads_parser(self):
@@ -49,11 +70,10 @@ class TestMain:
         main()
         assert self.parser.called
 
-    @patch('pydo.install')
-    def test_install_subcommand_calls_install(self, installMock):
+    def test_install_subcommand_calls_install(self):
         self.parser_args.subcommand = 'install'
         main()
-        assert installMock.called
+        assert self.install.called
 
     @pytest.mark.parametrize(
         'subcommand',
@@ -66,11 +86,7 @@ class TestMain:
             None
         ]
     )
-    def test_session_is_initialized_when_needed(
-        self,
-        session,
-        subcommand
-    ):
+    def test_session_is_initialized_when_needed(self, subcommand):
         self.parser_args.subcommand = subcommand
 
         main()
@@ -87,11 +103,7 @@ class TestMain:
             'del'
         ]
     )
-    def test_task_manager_is_initialized_when_needed(
-        self,
-        session,
-        subcommand
-    ):
+    def test_task_manager_is_initialized_when_needed(self, subcommand):
         self.parser_args.subcommand = subcommand
 
         main()
@@ -162,72 +174,6 @@ class TestMain:
             priority=priority,
         )
 
-    def test_done_subcommand_completes_task(self):
-        arguments = [
-            'done',
-            ulid.new().str
-        ]
-        self.parser_args.subcommand = arguments[0]
-        self.parser_args.ulid = arguments[1]
-        self.parser_args.parent = False
-
-        main()
-
-        self.tm.return_value.complete.assert_called_once_with(
-            id=arguments[1],
-            parent=False,
-        )
-
-    def test_done_parent_subcommand_completes_parent_task(self):
-        arguments = [
-            'done',
-            '-p',
-            ulid.new().str
-        ]
-        self.parser_args.subcommand = arguments[0]
-        self.parser_args.ulid = arguments[1]
-        self.parser_args.parent = True
-
-        main()
-
-        self.tm.return_value.complete.assert_called_once_with(
-            id=arguments[1],
-            parent=True,
-        )
-
-    def test_delete_subcommand_deletes_task(self):
-        arguments = [
-            'del',
-            ulid.new().str
-        ]
-        self.parser_args.subcommand = arguments[0]
-        self.parser_args.ulid = arguments[1]
-        self.parser_args.parent = False
-
-        main()
-
-        self.tm.return_value.delete.assert_called_once_with(
-            id=arguments[1],
-            parent=False,
-        )
-
-    def test_delete_parent_subcommand_deletes_parent_task(self):
-        arguments = [
-            'del',
-            '-p',
-            ulid.new().str
-        ]
-        self.parser_args.subcommand = arguments[0]
-        self.parser_args.ulid = arguments[1]
-        self.parser_args.parent = True
-
-        main()
-
-        self.tm.return_value.delete.assert_called_once_with(
-            id=arguments[1],
-            parent=True,
-        )
-
     @pytest.mark.parametrize(
         'subcommand',
         [
@@ -235,25 +181,23 @@ class TestMain:
             None,
         ]
     )
-    @patch('pydo.sessionmaker.return_value.return_value.query')
-    def test_open_subcommand_prints_report_by_default(self, mock, subcommand):
+    def test_open_subcommand_prints_report_by_default(self, subcommand):
         self.parser_args.subcommand = subcommand
 
         main()
 
-        assert call(models.Task) in mock.mock_calls
+        assert call(models.Task) in self.query.mock_calls
         assert call(state='open', type='task') \
-            in mock.return_value.filter_by.mock_calls
+            in self.query.return_value.filter_by.mock_calls
 
         self.task_report.assert_called_once_with(self.session)
         self.task_report.return_value.print.assert_called_once_with(
-            tasks=mock.return_value.filter_by.return_value,
+            tasks=self.query.return_value.filter_by.return_value,
             columns=self.config.get('report.open.columns'),
             labels=self.config.get('report.open.labels'),
         )
 
-    @patch('pydo.Projects')
-    def test_projects_subcommand_prints_report(self, projectMock):
+    def test_projects_subcommand_prints_report(self):
         arguments = [
             'projects',
         ]
@@ -261,15 +205,14 @@ class TestMain:
 
         main()
 
-        projectMock.assert_called_once_with(self.session)
+        self.projects.assert_called_once_with(self.session)
 
-        projectMock.return_value.print.assert_called_once_with(
+        self.projects.return_value.print.assert_called_once_with(
             columns=self.config.get('report.projects.columns'),
             labels=self.config.get('report.projects.labels')
         )
 
-    @patch('pydo.Tags')
-    def test_tags_subcommand_prints_report(self, tagsMock):
+    def test_tags_subcommand_prints_report(self):
         arguments = [
             'tags',
         ]
@@ -277,9 +220,9 @@ class TestMain:
 
         main()
 
-        tagsMock.assert_called_once_with(self.session)
+        self.tags.assert_called_once_with(self.session)
 
-        tagsMock.return_value.print.assert_called_once_with(
+        self.tags.return_value.print.assert_called_once_with(
             columns=self.config.get('report.tags.columns'),
             labels=self.config.get('report.tags.labels')
         )
@@ -287,7 +230,7 @@ class TestMain:
     def test_modify_subcommand_modifies_task(self):
         arguments = [
             'mod',
-            ulid.new().str,
+            TASK_ID,
             'pro:test',
         ]
         self.parser_args.subcommand = arguments[0]
@@ -309,7 +252,7 @@ class TestMain:
         arguments = [
             'mod',
             '-p',
-            ulid.new().str,
+            TASK_ID,
             'pro:test',
         ]
         self.parser_args.subcommand = arguments[0]
@@ -327,133 +270,76 @@ class TestMain:
             project='test',
         )
 
-    @patch('pydo.export')
-    def test_export_subcommand_calls_export(self, exportMock):
+    def test_export_subcommand_calls_export(self):
         self.parser_args.subcommand = 'export'
         main()
-        assert exportMock.called
-
-    def test_freeze_subcommand_freezes_task(self):
-        arguments = [
-            'freeze',
-            ulid.new().str
-        ]
-        self.parser_args.subcommand = arguments[0]
-        self.parser_args.ulid = arguments[1]
-        self.parser_args.parent = False
-
-        main()
-
-        self.tm.return_value.freeze.assert_called_once_with(
-            id=arguments[1],
-            parent=False,
-        )
-
-    def test_freeze_parent_subcommand_freezes_parent_task(self):
-        arguments = [
-            'freeze',
-            '-p',
-            ulid.new().str
-        ]
-        self.parser_args.subcommand = arguments[0]
-        self.parser_args.ulid = arguments[1]
-        self.parser_args.parent = True
-
-        main()
+        assert self.export.called
 
-        self.tm.return_value.freeze.assert_called_once_with(
-            id=arguments[1],
-            parent=True,
-        )
-
-    def test_unfreeze_subcommand_unfreezes_task(self):
-        arguments = [
-            'unfreeze',
-            ulid.new().str
+    @pytest.mark.parametrize(
+        'subcommand,method,parent',
+        [
+            ('done', 'complete', False),
+            ('done', 'complete', True),
+            ('del', 'delete', False),
+            ('del', 'delete', True),
+            ('freeze', 'freeze', False),
+            ('freeze', 'freeze', True),
+            ('unfreeze', 'unfreeze', False),
+            ('unfreeze', 'unfreeze', True),
         ]
-        self.parser_args.subcommand = arguments[0]
-        self.parser_args.ulid = arguments[1]
-        self.parser_args.parent = False
+    )
+    def test_task_subcommand_calls_task_manager(
+        self,
+        subcommand,
+        method,
+        parent,
+    ):
+        self.parser_args.subcommand = subcommand
+        self.parser_args.ulid = TASK_ID
+        self.parser_args.parent = parent
 
         main()
 
-        self.tm.return_value.unfreeze.assert_called_once_with(
-            id=arguments[1],
-            parent=False,
+        getattr(self.tm.return_value, method).assert_called_once_with(
+            id=TASK_ID,
+            parent=parent,
         )
 
-    def test_unfreeze_parent_subcommand_unfreezes_task(self):
-        arguments = [
-            'unfreeze',
-            '-p',
-            ulid.new().str
+    @pytest.mark.parametrize(
+        'subcommand,model,filters',
+        [
+            (
+                'repeating',
+                models.RecurrentTask,
+                {'state': 'open', 'recurrence_type': 'repeating'},
+            ),
+            (
+                'recurring',
+                models.RecurrentTask,
+                {'state': 'open', 'recurrence_type': 'recurring'},
+            ),
+            ('frozen', models.Task, {'state': 'frozen'}),
         ]
-        self.parser_args.subcommand = arguments[0]
-        self.parser_args.ulid = arguments[1]
-        self.parser_args.parent = True
-
-        main()
-
-        self.tm.return_value.unfreeze.assert_called_once_with(
-            id=arguments[1],
-            parent=True,
-        )
-
-    @patch('pydo.sessionmaker.return_value.return_value.query')
-    def test_repeating_subcommand_prints_repeating_parent_tasks(self, mock):
-        self.parser_args.subcommand = 'repeating'
-
-        main()
-
-        assert call(models.RecurrentTask) in mock.mock_calls
-        assert call(state='open', recurrence_type='repeating') \
-            in mock.return_value.filter_by.mock_calls
-
-        self.task_report.assert_called_once_with(
-            self.session,
-            models.RecurrentTask
-        )
-        self.task_report.return_value.print.assert_called_once_with(
-            tasks=mock.return_value.filter_by.return_value,
-            columns=self.config.get('report.repeating.columns'),
-            labels=self.config.get('report.repeating.labels'),
-        )
-
-    @patch('pydo.sessionmaker.return_value.return_value.query')
-    def test_recurring_subcommand_prints_recurring_parent_tasks(self, mock):
-        self.parser_args.subcommand = 'recurring'
-
-        main()
-
-        assert call(models.RecurrentTask) in mock.mock_calls
-        assert call(state='open', recurrence_type='recurring') \
-            in mock.return_value.filter_by.mock_calls
-
-        self.task_report.assert_called_once_with(
-            self.session,
-            models.RecurrentTask
-        )
-        self.task_report.return_value.print.assert_called_once_with(
-            tasks=mock.return_value.filter_by.return_value,
-            columns=self.config.get('report.recurring.columns'),
-            labels=self.config.get('report.recurring.labels'),
-        )
-
-    @patch('pydo.sessionmaker.return_value.return_value.query')
-    def test_frozen_subcommand_prints_frozen_parent_tasks(self, mock):
-        self.parser_args.subcommand = 'frozen'
+    )
+    def test_parent_subcommand_prints_parent_tasks(
+        self,
+        subcommand,
+        model,
+        filters,
+    ):
+        self.parser_args.subcommand = subcommand
 
         main()
 
-        assert call(models.Task) in mock.mock_calls
-        assert call(state='frozen') in mock.return_value.filter_by.mock_calls
+        assert call(model) in self.query.mock_calls
+        assert call(**filters) in self.query.return_value.filter_by.mock_calls
 
         self.task_report.assert_called_once_with(
             self.session,
             models.RecurrentTask
         )
         self.task_report.return_value.print.assert_called_once_with(
-            tasks=mock.return_value.filter_by.return_value,
-            columns=self.config.get('report.frozen.columns'),
-            labels=self.config.get('report.frozen.labels'),
+            tasks=self.query.return_value.filter_by.return_value,
+            columns=self.config.get('report.{}.columns'.format(subcommand)),
+            labels=self.config.get('report.{}.labels'.format(subcommand)),
         )
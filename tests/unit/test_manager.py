@@ -1,4 +1,3 @@
-from faker import Faker
 from pydo import config
 from pydo.fulids import fulid
 from pydo.manager import TaskManager, DateManager
@@ -32,10 +31,10 @@ class ManagerBaseTest:
     """
 
     @pytest.fixture(autouse=True)
-    def base_setup(self, session):
+    def base_setup(self, session, fake):
         self.datetime_patch = patch('pydo.manager.datetime', autospect=True)
         self.datetime = self.datetime_patch.start()
-        self.fake = Faker()
+        self.fake = fake
         self.log_patch = patch('pydo.manager.log', autospect=True)
         self.log = self.log_patch.start()
         self.session = session
@@ -106,6 +105,18 @@ class TestTaskManager(ManagerBaseTest):
 
         yield 'setup'
 
+    def _assert_closed_task_logged(self, state, task):
+        """
+        Assert that the manager logged the closing of the task.
+
+        Arguments:
+            state (str): Capitalized closing state, as shown in the log.
+            task (Task): Closed task.
+        """
+        assert call(
+            '{} task {}: {}'.format(state, task.id, task.title)
+        ) in self.log.debug.mock_calls
+
     @patch('pydo.manager.fulid')
     def test_manager_has_fulid_attribute_set(self, fulidMock):
         TaskManager(self.session)
@@ -667,16 +678,28 @@ class TestTaskManager(ManagerBaseTest):
         generated_task = self.session.query(Task).one()
         assert generated_task.project is project
 
-    def test_add_task_generates_project_if_doesnt_exist(self):
+    @pytest.mark.parametrize(
+        'argument,value,model',
+        [
+            ('project_id', 'non_existent', Project),
+            ('tags', ['non_existent'], Tag),
+        ]
+    )
+    def test_add_task_generates_element_if_doesnt_exist(
+        self,
+        argument,
+        value,
+        model,
+    ):
         title = self.fake.sentence()
 
-        self.manager.add(title=title, project_id='non_existent')
+        self.manager.add(title=title, **{argument: value})
 
         generated_task = self.session.query(Task).one()
-        project = self.session.query(Project).get('non_existent')
+        element = self.session.query(model).get('non_existent')
 
-        assert generated_task.project is project
-        assert isinstance(project, Project)
+        assert isinstance(element, model)
+        assert element.tasks == [generated_task]
 
     def test_add_task_assigns_tag_if_exist(self):
         tag = TagFactory.create()
@@ -687,70 +710,25 @@ class TestTaskManager(ManagerBaseTest):
         generated_task = self.session.query(Task).one()
         assert generated_task.tags == [tag]
 
-    def test_add_task_generates_tag_if_doesnt_exist(self):
-        title = self.fake.sentence()
-
-        self.manager.add(title=title, tags=['non_existent'])
-
-        generated_task = self.session.query(Task).one()
-        tag = self.session.query(Tag).get('non_existent')
-
-        assert generated_task.tags == [tag]
-        assert isinstance(tag, Tag)
-
-    def test_add_task_assigns_priority_if_exist(self):
-        title = self.fake.sentence()
-        priority = self.fake.random_number()
-
-        self.manager.add(title=title, priority=priority)
-
-        generated_task = self.session.query(Task).one()
-        assert generated_task.priority == priority
-
-    def test_add_task_assigns_value_if_exist(self):
-        title = self.fake.sentence()
-        value = self.fake.random_number()
-
-        self.manager.add(title=title, value=value)
-
-        generated_task = self.session.query(Task).one()
-        assert generated_task.value == value
-
-    def test_add_task_assigns_willpower_if_exist(self):
-        title = self.fake.sentence()
-        willpower = self.fake.random_number()
-
-        self.manager.add(title=title, willpower=willpower)
-
-        generated_task = self.session.query(Task).one()
-        assert generated_task.willpower == willpower
-
-    def test_add_task_assigns_fun_if_exist(self):
-        title = self.fake.sentence()
-        fun = self.fake.random_number()
-
-        self.manager.add(title=title, fun=fun)
-
-        generated_task = self.session.query(Task).one()
-        assert generated_task.fun == fun
-
-    def test_add_task_assigns_estimate_if_exist(self):
-        title = self.fake.sentence()
-        estimate = self.fake.random_number()
-
-        self.manager.add(title=title, estimate=estimate)
-
-        generated_task = self.session.query(Task).one()
-        assert generated_task.estimate == estimate
-
-    def test_add_task_assigns_body_if_exist(self):
+    @pytest.mark.parametrize(
+        'attribute,provider',
+        [
+            ('priority', 'random_number'),
+            ('value', 'random_number'),
+            ('willpower', 'random_number'),
+            ('fun', 'random_number'),
+            ('estimate', 'random_number'),
+            ('body', 'sentence'),
+        ]
+    )
+    def test_add_task_assigns_attribute_if_exist(self, attribute, provider):
         title = self.fake.sentence()
-        body = self.fake.sentence()
+        value = getattr(self.fake, provider)()
 
-        self.manager.add(title=title, body=body)
+        self.manager.add(title=title, **{attribute: value})
 
         generated_task = self.session.query(Task).one()
-        assert generated_task.body == body
+        assert getattr(generated_task, attribute) == value
 
     def test_add_task_assigns_default_agile_state_if_not_specified(self):
         title = self.fake.sentence()
@@ -888,18 +866,31 @@ class TestTaskManager(ManagerBaseTest):
 
         assert modified_task.project is new_project
 
-    def test_modify_task_generates_project_if_doesnt_exist(self):
+    @pytest.mark.parametrize(
+        'argument,value,model',
+        [
+            ('project_id', 'non_existent', Project),
+            ('tags', ['non_existent'], Tag),
+        ]
+    )
+    def test_modify_task_generates_element_if_doesnt_exist(
+        self,
+        argument,
+        value,
+        model,
+    ):
         task = self.factory.create(state='open')
 
         self.manager.modify(
             fulid().fulid_to_sulid(task.id, [task.id]),
-            project_id='non_existent')
+            **{argument: value}
+        )
 
         modified_task = self.session.query(Task).get(task.id)
-        project = self.session.query(Project).get('non_existent')
+        element = self.session.query(model).get('non_existent')
 
-        assert modified_task.project is project
-        assert isinstance(project, Project)
+        assert isinstance(element, model)
+        assert element.tasks == [modified_task]
 
     def test_modify_task_adds_tags(self):
         tag_1 = TagFactory.create()
@@ -926,90 +917,29 @@ class TestTaskManager(ManagerBaseTest):
         modified_task = self.session.query(Task).get(task.id)
         assert modified_task.tags == []
 
-    def test_modify_task_generates_tag_if_doesnt_exist(self):
-        task = self.factory.create(state='open')
-
-        self.manager.modify(
-            fulid().fulid_to_sulid(task.id, [task.id]),
-            tags=['non_existent'])
-
-        modified_task = self.session.query(Task).get(task.id)
-        tag = self.session.query(Tag).get('non_existent')
-
-        assert modified_task.tags == [tag]
-        assert isinstance(tag, Tag)
-
-    def test_modify_task_modifies_priority(self):
-        priority = self.fake.random_number()
-        task = self.factory.create(state='open')
-
-        self.manager.modify(
-            fulid().fulid_to_sulid(task.id, [task.id]),
-            priority=priority)
-
-        modified_task = self.session.query(Task).get(task.id)
-
-        assert modified_task.priority == priority
-
-    def test_modify_task_modifies_value(self):
-        value = self.fake.random_number()
-        task = self.factory.create(state='open')
-
-        self.manager.modify(
-            fulid().fulid_to_sulid(task.id, [task.id]),
-            value=value)
-
-        modified_task = self.session.query(Task).get(task.id)
-
-        assert modified_task.value == value
-
-    def test_modify_task_modifies_willpower(self):
-        willpower = self.fake.random_number()
-        task = self.factory.create(state='open')
-
-        self.manager.modify(
-            fulid().fulid_to_sulid(task.id, [task.id]),
-            willpower=willpower)
-
-        modified_task = self.session.query(Task).get(task.id)
-
-        assert modified_task.willpower == willpower
-
-    def test_modify_task_modifies_fun(self):
-        fun = self.fake.random_number()
-        task = self.factory.create(state='open')
-
-        self.manager.modify(
-            fulid().fulid_to_sulid(task.id, [task.id]),
-            fun=fun)
-
-        modified_task = self.session.query(Task).get(task.id)
-
-        assert modified_task.fun == fun
-
-    def test_modify_task_modifies_estimate(self):
-        estimate = self.fake.random_number()
-        task = self.factory.create(state='open')
-
-        self.manager.modify(
-            fulid().fulid_to_sulid(task.id, [task.id]),
-            estimate=estimate)
-
-        modified_task = self.session.query(Task).get(task.id)
-
-        assert modified_task.estimate == estimate
-
-    def test_modify_task_modifies_body(self):
-        body = self.fake.sentence()
+    @pytest.mark.parametrize(
+        'attribute,provider',
+        [
+            ('priority', 'random_number'),
+            ('value', 'random_number'),
+            ('willpower', 'random_number'),
+            ('fun', 'random_number'),
+            ('estimate', 'random_number'),
+            ('body', 'sentence'),
+        ]
+    )
+    def test_modify_task_modifies_attribute(self, attribute, provider):
+        value = getattr(self.fake, provider)()
         task = self.factory.create(state='open')
 
         self.manager.modify(
             fulid().fulid_to_sulid(task.id, [task.id]),
-            body=body)
+            **{attribute: value}
+        )
 
         modified_task = self.session.query(Task).get(task.id)
 
-        assert modified_task.body == body
+        assert getattr(modified_task, attribute) == value
 
     def test_modify_parent_only_modifies_desired_attributes(self):
         body = self.fake.sentence()
@@ -1168,21 +1098,11 @@ class TestTaskManager(ManagerBaseTest):
 
         assert result_child_task.closed == closed
         assert result_child_task.state == 'deleted'
-        assert call(
-            'Deleted task {}: {}'.format(
-                result_child_task.id,
-                result_child_task.title,
-            )
-        ) in self.log.debug.mock_calls
+        self._assert_closed_task_logged('Deleted', result_child_task)
 
         assert result_parent_task.closed == closed
         assert result_parent_task.state == 'deleted'
-        assert call(
-            'Deleted task {}: {}'.format(
-                result_parent_task.id,
-                result_parent_task.title,
-            )
-        ) in self.log.debug.mock_calls
+        self._assert_closed_task_logged('Deleted', result_parent_task)
 
     def test_delete_non_parent_task_deletes_child_and_fails_graceful(self):
         child_task = TaskFactory.create(
@@ -1198,12 +1118,7 @@ class TestTaskManager(ManagerBaseTest):
 
         assert result_child_task.closed == closed
         assert result_child_task.state == 'deleted'
-        assert call(
-            'Deleted task {}: {}'.format(
-                result_child_task.id,
-                result_child_task.title,
-            )
-        ) in self.log.debug.mock_calls
+        self._assert_closed_task_logged('Deleted', result_child_task)
 
         self.log.error.assert_called_once_with(
             "Task {} doesn't have a parent task".format(child_task.id)
@@ -1273,21 +1188,11 @@ class TestTaskManager(ManagerBaseTest):
 
         assert result_child_task.closed == closed
         assert result_child_task.state == 'completed'
-        assert call(
-            'Completed task {}: {}'.format(
-                result_child_task.id,
-                result_child_task.title,
-            )
-        ) in self.log.debug.mock_calls
+        self._assert_closed_task_logged('Completed', result_child_task)
 
         assert result_parent_task.closed == closed
         assert result_parent_task.state == 'completed'
-        assert call(
-            'Completed task {}: {}'.format(
-                result_parent_task.id,
-                result_parent_task.title,
-            )
-        ) in self.log.debug.mock_calls
+        self._assert_closed_task_logged('Completed', result_parent_task)
 
     def test_complete_non_parent_task_completes_child_and_fails_graceful(self):
         child_task = TaskFactory.create(
@@ -1303,12 +1208,7 @@ class TestTaskManager(ManagerBaseTest):
 
         assert result_child_task.closed == closed
         assert result_child_task.state == 'completed'
-        assert call(
-            'Completed task {}: {}'.format(
-                result_child_task.id,
-                result_child_task.title,
-            )
-        ) in self.log.debug.mock_calls
+        self._assert_closed_task_logged('Completed', result_child_task)
 
         self.log.error.assert_called_once_with(
             "Task {} doesn't have a parent task".format(child_task.id)
@@ -1759,75 +1659,35 @@ class TestDateManager:
         assert self.manager.convert('2019-05-05T10:00') == \
             datetime.datetime.strptime('2019-05-05T10:00', '%Y-%m-%dT%H:%M')
 
-    def test_convert_date_accepts_monday(self):
-        starting_date = datetime.date(2020, 1, 6)
-        assert self.manager.convert('monday', starting_date) == \
-            datetime.date(2020, 1, 13)
-
-    def test_convert_date_accepts_mon(self):
-        starting_date = datetime.date(2020, 1, 6)
-        assert self.manager.convert('mon', starting_date) == \
-            datetime.date(2020, 1, 13)
-
-    def test_convert_date_accepts_tuesday(self):
-        starting_date = datetime.date(2020, 1, 7)
-        assert self.manager.convert('tuesday', starting_date) == \
-            datetime.date(2020, 1, 14)
-
-    def test_convert_date_accepts_tue(self):
-        starting_date = datetime.date(2020, 1, 7)
-        assert self.manager.convert('tue', starting_date) == \
-            datetime.date(2020, 1, 14)
-
-    def test_convert_date_accepts_wednesday(self):
-        starting_date = datetime.date(2020, 1, 8)
-        assert self.manager.convert('wednesday', starting_date) == \
-            datetime.date(2020, 1, 15)
-
-    def test_convert_date_accepts_wed(self):
-        starting_date = datetime.date(2020, 1, 8)
-        assert self.manager.convert('wed', starting_date) == \
-            datetime.date(2020, 1, 15)
-
-    def test_convert_date_accepts_thursdday(self):
-        starting_date = datetime.date(2020, 1, 9)
-        assert self.manager.convert('thursdday', starting_date) == \
-            datetime.date(2020, 1, 16)
-
-    def test_convert_date_accepts_thu(self):
-        starting_date = datetime.date(2020, 1, 9)
-        assert self.manager.convert('thu', starting_date) == \
-            datetime.date(2020, 1, 16)
-
-    def test_convert_date_accepts_friday(self):
-        starting_date = datetime.date(2020, 1, 10)
-        assert self.manager.convert('friday', starting_date) == \
-            datetime.date(2020, 1, 17)
-
-    def test_convert_date_accepts_fri(self):
-        starting_date = datetime.date(2020, 1, 10)
-        assert self.manager.convert('fri', starting_date) == \
-            datetime.date(2020, 1, 17)
-
-    def test_convert_date_accepts_saturday(self):
-        starting_date = datetime.date(2020, 1, 11)
-        assert self.manager.convert('saturday', starting_date) == \
-            datetime.date(2020, 1, 18)
-
-    def test_convert_date_accepts_sat(self):
-        starting_date = datetime.date(2020, 1, 11)
-        assert self.manager.convert('sat', starting_date) == \
-            datetime.date(2020, 1, 18)
-
-    def test_convert_date_accepts_sunday(self):
-        starting_date = datetime.date(2020, 1, 12)
-        assert self.manager.convert('sunday', starting_date) == \
-            datetime.date(2020, 1, 19)
-
-    def test_convert_date_accepts_sun(self):
-        starting_date = datetime.date(2020, 1, 12)
-        assert self.manager.convert('sun', starting_date) == \
-            datetime.date(2020, 1, 19)
+    @pytest.mark.parametrize(
+        'human_date,starting_day,expected_day',
+        [
+            ('monday', 6, 13),
+            ('mon', 6, 13),
+            ('tuesday', 7, 14),
+            ('tue', 7, 14),
+            ('wednesday', 8, 15),
+            ('wed', 8, 15),
+            ('thursdday', 9, 16),
+            ('thu', 9, 16),
+            ('friday', 10, 17),
+            ('fri', 10, 17),
+            ('saturday', 11, 18),
+            ('sat', 11, 18),
+            ('sunday', 12, 19),
+            ('sun', 12, 19),
+        ]
+    )
+    def test_convert_date_accepts_weekdays(
+        self,
+        human_date,
+        starting_day,
+        expected_day,
+    ):
+        # From monday the 6th to sunday the 12th of January 2020
+        starting_date = datetime.date(2020, 1, starting_day)
+        assert self.manager.convert(human_date, starting_date) == \
+            datetime.date(2020, 1, expected_day)
 
     def test_convert_date_accepts_1d(self):
         starting_date = datetime.date(2020, 1, 12)
@@ -1852,6 +1712,9 @@ class TestDateManager:
         assert self.manager.convert('today').day == \
             self.now.day
 
+    def test_convert_date_takes_now_on_each_call(self):
+        assert self.manager.convert('now') >= self.now
+
     def test_convert_date_accepts_tomorrow(self):
         starting_date = datetime.date(2020, 1, 12)
         assert self.manager.convert('tomorrow', starting_date) == \
@@ -14,25 +14,21 @@ class BaseModelTest:
         self.model_attributes: List of model attributes to test
 
     Public attributes:
-        dummy_instance (Factory_boy object): Dummy instance of the model.
+        dummy_instance (Factory_boy object): Dummy instance of the model, it's
+            built without the database, as the tests only compare attributes.
     """
 
-    @pytest.fixture(autouse=True)
-    def base_setup(self, session):
-        self.session = session
-
     def test_attributes_defined(self):
         for attribute in self.model_attributes:
             assert getattr(self.model, attribute) == \
                 getattr(self.dummy_instance, attribute)
 
 
-@pytest.mark.usefixtures('base_setup')
 class TestTask(BaseModelTest):
 
     @pytest.fixture(autouse=True)
-    def setup(self, session):
-        self.dummy_instance = factories.TaskFactory.create()
+    def setup(self):
+        self.dummy_instance = factories.TaskFactory.build()
         self.model = models.Task(
             id=self.dummy_instance.id,
             agile=self.dummy_instance.agile,
@@ -58,12 +54,11 @@ class TestTask(BaseModelTest):
         ]
 
 
-@pytest.mark.usefixtures('base_setup')
 class TestRecurrentTask(BaseModelTest):
 
     @pytest.fixture(autouse=True)
-    def setup(self, session):
-        self.dummy_instance = factories.RecurrentTaskFactory.create()
+    def setup(self):
+        self.dummy_instance = factories.RecurrentTaskFactory.build()
         self.model = models.RecurrentTask(
             id=self.dummy_instance.id,
             agile=self.dummy_instance.agile,
@@ -92,12 +87,11 @@ class TestRecurrentTask(BaseModelTest):
         ]
 
 
-@pytest.mark.usefixtures('base_setup')
 class TestProject(BaseModelTest):
 
     @pytest.fixture(autouse=True)
-    def setup(self, session):
-        self.dummy_instance = factories.ProjectFactory.create()
+    def setup(self):
+        self.dummy_instance = factories.ProjectFactory.build()
         self.model = models.Project(
             id=self.dummy_instance.id,
             description=self.dummy_instance.description,
@@ -16,11 +16,11 @@ class TestInstall:
         log (mock): logging mock
         log_info (mock): log.info mock
         os (mock): os mock
-        session (Session object): Database session.
+        session (mock): Database session mock, install doesn't use it.
     """
 
     @pytest.fixture(autouse=True)
-    def setup(self, session):
+    def setup(self):
         self.alembic_patch = patch('pydo.ops.alembic', autospect=True)
         self.alembic = self.alembic_patch.start()
         self.homedir = os.path.expanduser('~')
@@ -31,7 +31,7 @@ class TestInstall:
         self.os.path.expanduser.side_effect = os.path.expanduser
         self.os.path.join.side_effect = os.path.join
         self.os.path.dirname.return_value = '/home/test/.venv/pydo/pydo'
-        self.session = session
+        self.session = Mock()
 
         yield 'setup'
 
@@ -76,11 +76,10 @@ class TestExport:
         log (mock): logging mock
         log_info (mock): log.info mock
         print(mock): print mock
-        session (Session object): Database session.
     """
 
     @pytest.fixture(autouse=True)
-    def setup(self, session):
+    def setup(self, connection):
         self.json_patch = patch('pydo.ops.json', autospect=True)
         self.json = self.json_patch.start()
         self.log = Mock()
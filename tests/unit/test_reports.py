@@ -1,8 +1,8 @@
-from faker import Faker
 from pydo import config
 from pydo.models import RecurrentTask, Task
 from pydo.reports import TaskReport, Projects, Tags
 from tests.factories import \
+    insert_tasks, \
     ProjectFactory, \
     RecurrentTaskFactory, \
     TagFactory, \
@@ -28,10 +28,10 @@ class BaseReport:
     """
 
     @pytest.fixture(autouse=True)
-    def base_setup(self, session):
+    def base_setup(self, session, fake):
         self.print_patch = patch('pydo.reports.print', autospect=True)
         self.print = self.print_patch.start()
-        self.fake = Faker()
+        self.fake = fake
         self.tabulate_patch = patch(
             'pydo.reports.tabulate',
             autospect=True
@@ -106,7 +106,7 @@ class TestTaskReport(BaseReport):
         desired_columns.pop(due_index)
         desired_labels.pop(due_index)
 
-        TaskFactory.create_batch(100, due=None)
+        insert_tasks(session, 100, due=None)
 
         tasks = session.query(Task).filter_by(state='open')
 
@@ -130,7 +130,7 @@ class TestTaskReport(BaseReport):
         labels = desired_labels.copy()
         labels.append('unexistent_label')
 
-        TaskFactory.create_batch(100, due=None)
+        insert_tasks(session, 100, due=None)
 
         tasks = session.query(Task).filter_by(state='open')
 
@@ -295,7 +295,6 @@ class TestTaskReport(BaseReport):
 
         self.report = TaskReport(session, RecurrentTask)
         TaskFactory.create_batch(1, state='open')
-        # RecurrentTaskFactory.create_batch(1, state='open')
 
         tasks = session.query(Task).filter_by(state='open')
 